@@ -6,12 +6,10 @@ Channel Dialer - Intelligent digit queue system for channel switching
 import threading
 import subprocess
 import json
-from collections import deque
 from contextlib import contextmanager
 
 # Import utilities (including our new time/timer wrappers)
-import utils
-from utils import safe_execute, write_json_to_socket, get_now, start_timer
+from utils import write_json_to_socket, get_now, get_monotonic, start_timer
 
 # Import Easter egg system
 from easter_eggs import EasterEggCooldownManager, EasterEggActions, EasterEggRegistry
@@ -19,27 +17,36 @@ from state_manager import StateManager
 
 # Configuration
 VALID_CHANNELS = [1, 2, 3, 8, 9, 13]
+# Precomputed lookups so tuning never scans the channel list
+_VALID_SET = frozenset(VALID_CHANNELS)
+_NEXT_CHAN = {c: VALID_CHANNELS[(i + 1) % len(VALID_CHANNELS)] for i, c in enumerate(VALID_CHANNELS)}
+_PREV_CHAN = {c: VALID_CHANNELS[(i - 1) % len(VALID_CHANNELS)] for i, c in enumerate(VALID_CHANNELS)}
 SOCKET_PATH = "/home/appuser/FieldStation42/runtime/channel.socket"
 DIGIT_TIMEOUT = 1.5
 DISPLAY_DELAY = 0.4
 
 class ChannelDialer:
-    def __init__(self, digit_timeout=DIGIT_TIMEOUT, display_controller=None):
+    def __init__(self, digit_timeout=DIGIT_TIMEOUT, display_controller=None, send_command=None):
         self.state = StateManager()
-        self.digit_queue = deque()
+        self._digits = ''  # Dialed-so-far sequence; short and only ever cleared wholesale
         self.digit_timeout = digit_timeout
         self.last_digit_time = 0
-        self.timer = None
-        self.lock = threading.Lock()
+        self._digit_deadline = 0  # When the dialed sequence is processed
+        self.timer = None  # One timer per dialing session, not per digit
+        self._flash_timer = None  # Pending restore of the channel number after a flash
+        self._flash_seq = 0  # Bumped on every cancel; a restore only runs if its seq is current
+        self.lock = threading.RLock()  # Re-entered when an Easter egg flashes from add_digit
         self.display = display_controller
+        # Socket writes go through the caller's writer (if any) so they stay ordered with its own
+        self.send_command = send_command or write_json_to_socket
         
         # Load starting channel from state
         self.current_channel = self.state.get("current_channel", VALID_CHANNELS[0])
-        if self.current_channel not in VALID_CHANNELS:
+        if self.current_channel not in _VALID_SET:
             self.current_channel = VALID_CHANNELS[0]
         
-        # Add Easter egg protection
-        self.last_easter_egg_time = 0
+        # Add Easter egg protection (None = no Easter egg fired yet)
+        self.last_easter_egg_time = None
         self.easter_egg_debounce = 2.0  # 2 second cooldown after Easter egg
 
         # Initialize cooldown manager first
@@ -61,7 +68,7 @@ class ChannelDialer:
             print(f"Lock operation error: {e}")
             # Force cleanup on error
             try:
-                self.digit_queue.clear()
+                self._digits = ''
                 if self.timer:
                     self.timer.cancel()
                     self.timer = None
@@ -76,26 +83,54 @@ class ChannelDialer:
         if not self.display:
             return
         try:
-            if is_text:
+            if value is None:
+                self.display.clear_display()
+            elif is_text:
                 self.display.display_text(value)
             else:
                 self.display.display_number(value)
         except Exception as e:
             print(f"Display update error: {e}")
 
+    def _cancel_flash(self):
+        """Drop a pending channel-number restore"""
+        with self.lock:
+            self._flash_seq += 1  # A restore already past cancel() sees it is stale
+            if self._flash_timer:
+                self._flash_timer.cancel()
+                self._flash_timer = None
+
+    def _restore_display(self, seq):
+        with self.lock:
+            # Superseded or cancelled while waiting - the newer flash owns the display
+            if seq != self._flash_seq:
+                return
+            self._flash_timer = None
+            self._update_display(self.current_channel)
+
+    def _restore_display_after(self, delay):
+        """Show the current channel again after delay, without blocking the caller"""
+        with self.lock:
+            self._cancel_flash()
+            self._flash_timer = start_timer(delay, self._restore_display, args=[self._flash_seq])
+
+    def flash(self, text, duration):
+        """Show text (or a blank display if None) briefly, then the current channel"""
+        with self.lock:
+            self._update_display(text, is_text=True)
+            self._restore_display_after(duration)
+
     def _cancel_timer(self):
         """Safely cancel existing timer"""
         if self.timer:
             self.timer.cancel()
             self.timer = None
 
-    def _get_current_sequence(self):
-        """Get current digit sequence as string"""
-        return ''.join(self.digit_queue)
-
     def _is_in_easter_egg_debounce(self):
         """Check if we're still in Easter egg debounce period"""
-        return (get_now() - self.last_easter_egg_time) < self.easter_egg_debounce
+        if self.last_easter_egg_time is None:
+            return False
+        return (get_monotonic() - self.last_easter_egg_time) < self.easter_egg_debounce
 
     def _execute_easter_egg(self, sequence):
         """Execute Easter egg with proper cooldown handling"""
@@ -107,9 +142,8 @@ class ChannelDialer:
         
         if success:
             # Set debounce timestamp only if Easter egg actually executed
-            self.last_easter_egg_time = get_now()
-            utils.sleep(1)
-            self._update_display(self.current_channel)
+            self.last_easter_egg_time = get_monotonic()
+            self._restore_display_after(1)
         
         return success
 
@@ -125,69 +159,77 @@ class ChannelDialer:
                 print(f"🔄 Ignoring digit {digit} - Easter egg debounce active")
                 return
 
-            self.digit_queue.append(str(digit))
-            self.last_digit_time = get_now()
+            self._cancel_flash()  # Dialed digits replace whatever was flashing
+            self._digits += str(digit)
+            self.last_digit_time = get_monotonic()
+            self._digit_deadline = self.last_digit_time + self.digit_timeout
 
-            current_sequence = self._get_current_sequence()
+            current_sequence = self._digits
             self._update_display(current_sequence)
 
-            self._cancel_timer()  # Cancel any existing timer
-
-            # Check for immediate Easter egg matches
-            if self._execute_easter_egg(current_sequence):
-                self.digit_queue.clear()
+            # Check for immediate Easter egg matches (skipped for plain channel numbers)
+            if self.easter_registry.might_match(current_sequence) and self._execute_easter_egg(current_sequence):
+                self._digits = ''
                 self._cancel_timer()  # Double-cancel to be absolutely sure
                 print("🎮 Ready for new input...")
                 return
 
-            # Set timer for regular channel processing
-            self.timer = start_timer(self.digit_timeout, self._process_channel)
+            # Arm the timer for the first digit only; later digits just push the deadline
+            if not self.timer:
+                self.timer = start_timer(self.digit_timeout, self._on_digit_timeout)
 
     def clear_queue(self):
         """Clear the digit queue and reset cooldown"""
         with self._safe_lock():
-            self.digit_queue.clear()
+            self._digits = ''
             self._cancel_timer()
             # Reset Easter egg debounce when manually clearing
-            self.last_easter_egg_time = 0
+            self.last_easter_egg_time = None
+            self._cancel_flash()
             self._update_display(self.current_channel)
 
+    def _on_digit_timeout(self):
+        """Timer callback - re-arms itself if more digits arrived since it was set"""
+        with self._safe_lock():
+            if not self._digits:
+                self.timer = None
+                return
+            remaining = self._digit_deadline - get_monotonic()
+            if remaining > 0:
+                self.timer = start_timer(remaining, self._on_digit_timeout)
+                return
+        self._process_channel()
+
     def _process_channel(self):
         """Process accumulated digits as channel number"""
         with self._safe_lock():
-            if not self.digit_queue:
+            channel_str, self._digits = self._digits, ''
+            self.timer = None
+            if not channel_str:
                 return
 
-            channel_str = self._get_current_sequence()
-
-            # Final Easter egg check
+            # Final Easter egg check - under the lock, like the immediate match in add_digit,
+            # so the egg's display writes cannot interleave with a flash or a new digit
             if self._execute_easter_egg(channel_str):
-                self.digit_queue.clear()
-                self.timer = None
                 return
 
-            # Process as channel number
-            try:
-                channel_num = int(channel_str)
-                self.tune_to_channel(channel_num)
-            except ValueError:
-                self._show_error("ERR")
-
-            self.digit_queue.clear()
-            self.timer = None
+        # Process as channel number (tuning does not need the lock)
+        try:
+            channel_num = int(channel_str)
+            self.tune_to_channel(channel_num)
+        except ValueError:
+            self._show_error("ERR")
 
     def _show_error(self, error_text):
         """Show error message briefly then return to current channel"""
-        print(f"❌ Invalid channel sequence")
-        self._update_display(error_text, is_text=True)
-        utils.sleep(1)
-        self._update_display(self.current_channel)
+        print("❌ Invalid channel sequence")
+        self.flash(error_text, 1)
 
     def tune_to_channel(self, channel):
         """Tune to specific channel with validation"""
         print(f"📺 Attempting to tune to channel {channel}")
 
-        is_valid = channel in VALID_CHANNELS
+        is_valid = channel in _VALID_SET
 
         if is_valid:
             print(f"✅ Valid channel: {channel}")
@@ -199,7 +241,7 @@ class ChannelDialer:
             self.state.update(current_channel=channel)
 
             # Send command...
-            write_json_to_socket({
+            self.send_command({
                 "command": "direct",
                 "channel": channel,
                 "valid": is_valid,
@@ -216,26 +258,19 @@ class ChannelDialer:
         self.display.send_display_command("LED:ack")
 
         display_text = "UP" if direction > 0 else "Dn"
-        self._update_display(display_text, is_text=True)
-        utils.sleep(DISPLAY_DELAY)
+        self.flash(display_text, DISPLAY_DELAY)
 
-        # Calculate new channel index
-        try:
-            current_idx = VALID_CHANNELS.index(self.current_channel)
-        except ValueError:
-            current_idx = 0
-
-        new_idx = (current_idx + direction) % len(VALID_CHANNELS)
-        new_channel = VALID_CHANNELS[new_idx]
+        # Unknown current channel steps as if from the first one
+        neighbors = _NEXT_CHAN if direction > 0 else _PREV_CHAN
+        new_channel = neighbors.get(self.current_channel) or neighbors[VALID_CHANNELS[0]]
 
         print(f"📺 Channel {display_text}: {self.current_channel} -> {new_channel}")
         self.current_channel = new_channel
-        self._update_display(self.current_channel)
-        
+
         # Save state
         self.state.update(current_channel=new_channel)
 
-        write_json_to_socket({
+        self.send_command({
             "command": "up" if direction > 0 else "down",
             "channel": self.current_channel,
             "timestamp": get_now()
@@ -255,10 +290,11 @@ class ChannelDialer:
         if not config:
             print(f"❌ Unknown immediate Easter egg: {easter_egg_id}")
             return False
+        cooldown_id = config.cooldown_key or easter_egg_id
 
         # Check cooldown using the cooldown manager
-        if not self.cooldown_manager.can_activate(easter_egg_id, config['cooldown']):
-            remaining = self.cooldown_manager.get_time_until_available(easter_egg_id, config['cooldown'])
+        if not self.cooldown_manager.can_activate(cooldown_id, config.cooldown):
+            remaining = self.cooldown_manager.get_time_until_available(cooldown_id, config.cooldown)
             minutes = remaining // 60
             seconds = remaining % 60
             if minutes > 0:
@@ -267,27 +303,26 @@ class ChannelDialer:
                 print(f"⏳ {easter_egg_id} still in cooldown ({seconds:.0f}s remaining)")
             return False
 
-        print(f"🎯 {config['message']}")
+        print(f"🎯 {config.message}")
         if self.display:
-            self._update_display(config['display'], is_text=True)
+            self._update_display(config.display, is_text=True)
 
         try:
             # Activate the cooldown first
             self.cooldown_manager.activate_easter_egg(
-                easter_egg_id, 
-                config['cooldown'], 
-                config.get('duration'), 
-                config.get('cleanup')
+                cooldown_id, 
+                config.cooldown, 
+                config.duration, 
+                config.cleanup
             )
             
             # Then execute the action
-            config['action']()
-            
-            utils.sleep(0.5)
-            self._update_display(self.current_channel)
+            config.action()
+
+            self._restore_display_after(0.5)
             return True
         except Exception as e:
-            print(f"⚠️ Immediate easter egg failed: {e}")
+            print(f"⚠️ Immediate easter egg {easter_egg_id} failed: {e}")
             return False
 
     # Convenience methods for Easter egg management
@@ -3,9 +3,18 @@
 Display Controller - 7-segment display communication via serial
 """
 
+import serial
 import utils
 import threading
 
+# Commands that configure the display rather than change what it shows - never coalesced
+CONTROL_COMMANDS = ("DISP:BRT:", "DISP:ON", "DISP:OFF")
+# How long the writer lets a burst accumulate before sending it as one transfer
+TX_COALESCE_WINDOW = 0.005
+
+def _is_text_command(command):
+    return command.startswith("DISP:") and not command.startswith(CONTROL_COMMANDS)
+
 
 class DisplayController:
     """Handles 7-segment display communication via serial"""
@@ -15,6 +24,13 @@ class DisplayController:
         self.display_device = display_device
         self.baudrate = baudrate
         self.lock = threading.Lock()
+        self._last_displayed = None  # Last DISP: text command actually written
+
+        # Pending commands, drained by the writer thread (or inline if none is running)
+        self._tx = []
+        self._tx_cond = threading.Condition()
+        self._writer = None
+        self._closing = False
         
         if display_device:
             self.connect_display()
@@ -23,9 +39,11 @@ class DisplayController:
         """Connect to the display serial device"""
         try:
             if self.display_device:
+                self._last_displayed = None
                 self.display_serial = serial.Serial(self.display_device, self.baudrate, timeout=1)
                 utils.sleep(0.1)  # Give display time to initialize
                 print(f"📟 Display connected on {self.display_device}")
+                self.start_writer()
                 # Test the display
                 self.display_text("INIT")
                 utils.sleep(0.5)
@@ -34,22 +52,95 @@ class DisplayController:
             print(f"❌ Failed to connect to display: {e}")
             self.display_serial = None
     
-    def send_display_command(self, command):
-        """Send command to display with error handling"""
-        if not self.display_serial:
-            print(f"📟 Display command (no device): {command}")
-            return False
-            
+    def start_writer(self):
+        """Move serial writes onto a background thread so callers never wait on the UART"""
+        if self._writer:
+            return
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
+    def _writer_loop(self):
+        while True:
+            with self._tx_cond:
+                self._tx_cond.wait_for(lambda: self._tx or self._closing)
+                if self._closing:
+                    return  # close() sends whatever is left
+            utils.sleep(TX_COALESCE_WINDOW)  # Let the rest of a burst (e.g. LED + text) join
+            self._flush_tx()
+
+    def _flush_tx(self):
+        """Write all pending commands in a single serial transaction"""
+        with self._tx_cond:
+            batch, self._tx = self._tx, []
+        if not batch:
+            return True
+
+        # Only the last text in a batch is sent: anything it supersedes would have been on
+        # the panel for a few milliseconds at most. Timed flashes (dialer restore timers,
+        # DisplayQueue sleeps) always land in separate batches, so they are never dropped.
+        last_text = None
+        for i, command in enumerate(batch):
+            if _is_text_command(command):
+                last_text = i
+
+        shown = self._last_displayed
+        commands = []
+        for i, command in enumerate(batch):
+            if _is_text_command(command):
+                # Skip redundant text updates (e.g. rapid dialing re-sending the same digits)
+                if i != last_text or command == shown:
+                    continue
+                shown = command
+            elif command.startswith(CONTROL_COMMANDS):
+                shown = None  # ON/OFF/brightness may blank the panel - never dedupe against it
+            commands.append(command)
+        if not commands:
+            return True
+
         try:
+            payload = "".join(f"{command}\r\n" for command in commands).encode('ascii', errors='replace')
+            # The lock only guards the port itself
             with self.lock:
-                cmd_bytes = f"{command}\r\n".encode('ascii')
-                self.display_serial.write(cmd_bytes)
+                self.display_serial.write(payload)
                 self.display_serial.flush()
+            self._last_displayed = shown
+            for command in commands:
                 print(f"📟 Display: {command}")
-                return True
+            return True
         except Exception as e:
+            self._last_displayed = None  # Unknown what made it out - resend the next text
             print(f"❌ Display error: {e}")
             return False
+
+    def close(self, timeout=2):
+        """Stop the writer, send everything still queued, then close the port"""
+        if self._writer:
+            with self._tx_cond:
+                self._closing = True
+                self._tx_cond.notify()
+            self._writer.join(timeout=timeout)
+            self._writer = None
+        if not self.display_serial:
+            return
+        self._flush_tx()
+        try:
+            self.display_serial.close()
+        finally:
+            self.display_serial = None
+
+    def send_display_command(self, command):
+        """Send command to display with error handling"""
+        if not self.display_serial:
+            print(f"📟 Display command (no device): {command}")
+            return False
+
+        with self._tx_cond:
+            self._tx.append(command)
+            self._tx_cond.notify()
+
+        if not self._writer:
+            return self._flush_tx()  # No writer thread - write inline
+        return True
     
     def display_text(self, text):
         """Display text (up to 4 chars)"""
@@ -1,52 +1,97 @@
 import threading
 import utils
-from queue import Queue, Empty
+
+QUEUE_CAPACITY = 32
+
+class Ring:
+    """Fixed-capacity FIFO on a preallocated list - overwrites the oldest item when full"""
+    __slots__ = ('buf', 'head', 'size', 'cap')
+
+    def __init__(self, cap):
+        self.buf = [None] * cap
+        self.head = 0
+        self.size = 0
+        self.cap = cap
+
+    def __len__(self):
+        return self.size
+
+    def push(self, item):
+        """Append item; returns False if the oldest item had to be dropped"""
+        if self.size == self.cap:
+            self.buf[self.head] = item
+            self.head = (self.head + 1) % self.cap
+            return False
+        self.buf[(self.head + self.size) % self.cap] = item
+        self.size += 1
+        return True
+
+    def pop(self):
+        """Remove and return the oldest item"""
+        item = self.buf[self.head]
+        self.buf[self.head] = None
+        self.head = (self.head + 1) % self.cap
+        self.size -= 1
+        return item
 
 class DisplayQueue:
-    def __init__(self, display_controller):
+    def __init__(self, display_controller, capacity=QUEUE_CAPACITY):
         self.display_controller = display_controller
-        self.queue = Queue()
+        self.queue = Ring(capacity)
+        self._cond = threading.Condition()
         self.thread = threading.Thread(target=self._worker, daemon=True)
         self._stop = threading.Event()
 
     def start(self):
         self.thread.start()
 
-    def stop(self):
-        self.queue.put(("__EXIT__", None))
+    def stop(self, final_text=None, final_clear=False, timeout=2):
+        """Play optional farewell frames, then stop once everything queued has run"""
+        if final_text:
+            self.show_text(final_text)
+            self.sleep(1)
+        if final_clear:
+            self.clear()
+        self._put(("__EXIT__", None))
+        self.thread.join(timeout=timeout)
         self._stop.set()
-        self.thread.join(timeout=2)
+
+    def _put(self, item):
+        with self._cond:
+            self.queue.push(item)
+            self._cond.notify()
 
     def _worker(self):
         while not self._stop.is_set():
-            try:
-                cmd, value = self.queue.get(timeout=1)
-                if cmd == "__EXIT__":
-                    break
-                if cmd == "text":
-                    self.display_controller.display_text(value)
-                elif cmd == "number":
-                    self.display_controller.display_number(value)
-                elif cmd == "clear":
-                    self.display_controller.clear_display()
-                elif cmd == "brightness":
-                    self.display_controller.set_brightness(value)
-                elif cmd == "sleep":
-                    utils.sleep(value)
-            except Empty:
-                continue
+            with self._cond:
+                if not self._cond.wait_for(lambda: len(self.queue), timeout=1):
+                    continue
+                cmd, value = self.queue.pop()
+
+            if cmd == "__EXIT__":
+                break
+            if cmd == "text":
+                self.display_controller.display_text(value)
+            elif cmd == "number":
+                self.display_controller.display_number(value)
+            elif cmd == "clear":
+                self.display_controller.clear_display()
+            elif cmd == "brightness":
+                self.display_controller.set_brightness(value)
+            elif cmd == "sleep":
+                utils.sleep(value)
 
     def show_text(self, text):
-        self.queue.put(("text", text))
+        self._put(("text", text))
 
     def show_number(self, number):
-        self.queue.put(("number", number))
+        self._put(("number", number))
 
     def clear(self):
-        self.queue.put(("clear", None))
+        self._put(("clear", None))
 
     def sleep(self, seconds):
-        self.queue.put(("sleep", seconds))
+        self._put(("sleep", seconds))
 
     def set_brightness(self, level):
-        self.queue.put(("brightness", level))
+        self._put(("brightness", level))
@@ -1,13 +1,15 @@
 import threading
 import random
 from collections import defaultdict
+from functools import partial
 
 # Import shared utilities
 import utils
-from utils import safe_execute, send_key_to_mpv, get_now, start_timer
+from utils import send_key_to_mpv, get_monotonic, start_timer
 
 class EasterEggCooldownManager:
     """Manages cooldowns, expirations, and automatic cleanup for Easter eggs"""
+    __slots__ = ("last_activation", "active_effects", "cleanup_timers", "lock", "cleanup_lock")
 
     def __init__(self):
         # Track when each Easter egg was last activated
@@ -22,17 +24,22 @@ class EasterEggCooldownManager:
         # Lock for thread safety
         self.lock = threading.Lock()
 
+        # Serializes cleanup callbacks so expiring effects never interleave display/MPV writes
+        self.cleanup_lock = threading.Lock()
+
     def can_activate(self, easter_egg_id, cooldown_duration):
         """Check if Easter egg can be activated (not in cooldown)"""
         with self.lock:
-            last_time = self.last_activation.get(easter_egg_id, 0)
-            time_since_last = get_now() - last_time
+            last_time = self.last_activation.get(easter_egg_id)
+            if last_time is None:
+                return True
+            time_since_last = get_monotonic() - last_time
             return time_since_last >= cooldown_duration
 
     def activate_easter_egg(self, easter_egg_id, cooldown_duration, effect_duration=None, cleanup_callback=None):
         """Activate Easter egg and set up expiration if needed"""
         with self.lock:
-            now = get_now()
+            now = get_monotonic()
             self.last_activation[easter_egg_id] = now
 
             # If this has an expiring effect, set up automatic cleanup
@@ -60,31 +67,34 @@ class EasterEggCooldownManager:
                 del self.cleanup_timers[easter_egg_id]
 
         print(f"⏰ Effect '{easter_egg_id}' has expired - cleaning up")
-        try:
-            cleanup_callback()
-        except Exception as e:
-            print(f"⚠️ Cleanup failed for {easter_egg_id}: {e}")
+        with self.cleanup_lock:
+            try:
+                cleanup_callback()
+            except Exception as e:
+                print(f"⚠️ Cleanup failed for {easter_egg_id}: {e}")
  
+    # Read-only queries below skip the lock: single dict lookups are atomic
+    # under the GIL, and a momentarily stale answer is harmless for status.
     def is_effect_active(self, easter_egg_id):
         """Check if an effect is currently active"""
-        with self.lock:
-            return easter_egg_id in self.active_effects
+        return easter_egg_id in self.active_effects
 
     def get_time_until_available(self, easter_egg_id, cooldown_duration):
         """Get time in seconds until Easter egg is available again"""
-        with self.lock:
-            last_time = self.last_activation.get(easter_egg_id, 0)
-            time_since_last = get_now() - last_time
-            remaining = cooldown_duration - time_since_last
-            return max(0, remaining)
+        last_time = self.last_activation.get(easter_egg_id)
+        if last_time is None:
+            return 0
+        time_since_last = get_monotonic() - last_time
+        remaining = cooldown_duration - time_since_last
+        return max(0, remaining)
 
     def get_effect_time_remaining(self, easter_egg_id):
         """Get time in seconds until effect expires"""
-        with self.lock:
-            if easter_egg_id not in self.active_effects:
-                return 0
-            remaining = self.active_effects[easter_egg_id] - get_now()
-            return max(0, remaining)
+        expires_at = self.active_effects.get(easter_egg_id)
+        if expires_at is None:
+            return 0
+        remaining = expires_at - get_monotonic()
+        return max(0, remaining)
 
     def force_cleanup(self, easter_egg_id):
         """Manually clean up an effect"""
@@ -105,141 +115,117 @@ class EasterEggCooldownManager:
 
 class EasterEggActions:
     """Enhanced Easter egg actions with expiration support"""
+    __slots__ = ("dialer",)
+
+    # Expiring effects: name -> (message once cleared, whether MPV effects need clearing)
+    _CLEANUPS = {
+        "emergency": ("🚨 Emergency mode effects cleared", False),
+        "demon": ("😈 Demon mode effects cleared", True),
+        "party": ("🎉 Party mode effects cleared", True),
+    }
 
     def __init__(self, dialer):
         self.dialer = dialer
 
+    def _cleanup(self, effect):
+        """Shared cleanup for expiring effects (errors are reported by the cooldown manager)"""
+        message, clear_mpv = self._CLEANUPS[effect]
+        self.dialer.display.send_display_command("LED:off")
+        if clear_mpv:
+            send_key_to_mpv('h')  # Clear MPV effects
+        print(message)
+
     def emergency_mode(self):
         """911 - Emergency broadcast mode with 30 min duration"""
-        try:
-            print("🚨 Emergency mode activated")
-            self.dialer.display.send_display_command("LED:red-blue 10")
-            utils.sleep(0.5)
-            self.dialer.display.send_display_command("DISP:COPS")
-            print("🚨 Emergency LED effects active for 30 minutes")
-        except Exception as e:
-            print(f"⚠️ Emergency mode failed: {e}")
-
-    def _cleanup_emergency_mode(self):
-        """Cleanup for emergency mode"""
-        try:
-            self.dialer.display.send_display_command("LED:off")
-            print("🚨 Emergency mode effects cleared")
-        except Exception as e:
-            print(f"⚠️ Emergency cleanup failed: {e}")
+        send = self.dialer.display.send_display_command
+        print("🚨 Emergency mode activated")
+        send("LED:red-blue 10")
+        utils.sleep(0.5)
+        send("DISP:COPS")
+        print("🚨 Emergency LED effects active for 30 minutes")
 
     def demon_mode(self):
         """666 - Demon mode with visual effects for 15 minutes"""
         print("😈 Demon mode activated")
-        try:
-            send_key_to_mpv('m')
-            self.dialer.display.send_display_command("LED:pulse-red 20")
-            print("😈 Demon effects active for 15 minutes")
-        except Exception as e:
-            print(f"⚠️ Demon mode failed: {e}")
-
-    def _cleanup_demon_mode(self):
-        """Cleanup for demon mode"""
-        try:
-            self.dialer.display.send_display_command("LED:off")
-            send_key_to_mpv('h')  # Clear MPV effects
-            print("😈 Demon mode effects cleared")
-        except Exception as e:
-            print(f"⚠️ Demon cleanup failed: {e}")
+        send_key_to_mpv('m')
+        self.dialer.display.send_display_command("LED:pulse-red 20")
+        print("😈 Demon effects active for 15 minutes")
 
     def party_time(self):
         """420 - Party mode with effects for 20 minutes"""
         print("🎉 Party mode activated")
-        try:
-            send_key_to_mpv('b')
-            self.dialer.display.send_display_command("LED:rainbow 60")
-            utils.sleep(1)
-            self.dialer.display.send_display_command("DISP:RAST")
-            utils.sleep(1)
-            self.dialer.display.send_display_command("DISP:FARI")
-            utils.sleep(1)
-            print("🎉 Party effects active for 20 minutes")
-        except Exception as e:
-            print(f"⚠️ Party mode failed: {e}")
-
-    def _cleanup_party_time(self):
-        """Cleanup for party mode"""
-        try:
-            self.dialer.display.send_display_command("LED:off")
-            send_key_to_mpv('h')  # Clear MPV effects
-            print("🎉 Party mode effects cleared")
-        except Exception as e:
-            print(f"⚠️ Party cleanup failed: {e}")
+        send = self.dialer.display.send_display_command
+        sleep = utils.sleep
+        send_key_to_mpv('b')
+        send("LED:rainbow 60")
+        sleep(1)
+        send("DISP:RAST")
+        sleep(1)
+        send("DISP:FARI")
+        sleep(1)
+        print("🎉 Party effects active for 20 minutes")
 
     def full_reset(self):
         """0000 - Complete system reset (instant effect + cleanup all)"""
-        try:
-            # Force cleanup of ALL active effects
-            self.dialer.cooldown_manager.cleanup_all()
-
-            # Clear LED effects
-            self.dialer.display.send_display_command("LED:off")
-            print("🔄 LED reset to off")
+        # Force cleanup of ALL active effects
+        self.dialer.cooldown_manager.cleanup_all()
 
-            # Reset channel to first valid
-            self.dialer.tune_to_channel(1)
-            print("🔄 Channel reset to first valid")
+        # Clear LED effects
+        self.dialer.display.send_display_command("LED:off")
+        print("🔄 LED reset to off")
 
-            # Clear MPV effects
-            send_key_to_mpv('h')
-            print("🔄 All effects cleared and system reset")
+        # Reset channel to first valid
+        self.dialer.tune_to_channel(1)
+        print("🔄 Channel reset to first valid")
 
-        except Exception as e:
-            print(f"⚠️ Reset operation failed: {e}")
+        # Clear MPV effects
+        send_key_to_mpv('h')
+        print("🔄 All effects cleared and system reset")
 
     def show_404_error(self):
         """404 - Show error page (instant effect)"""
-        try:
-            self.dialer.display.send_display_command("LED:nack")
-            self.dialer.display.send_display_command("DISP:404")
-            utils.sleep(1.1)
-            self.dialer.display.send_display_command("LED:nack")
-            self.dialer.display.send_display_command("DISP:huh")
-            utils.sleep(1.4)
-            self.dialer.display.send_display_command("LED:nack")
-            self.dialer.display.send_display_command("DISP:.404")
-            utils.sleep(1)
-            self.dialer.display.send_display_command("LED:ack")
-            self.dialer.display.send_display_command("DISP:.huh")
-            utils.sleep(1.4)
-            self.dialer.display.send_display_command("LED:nack")
-            self.dialer.display.send_display_command("DISP:.404")
-            utils.sleep(1.4)
-            self.dialer.display.send_display_command("LED:nack")
-            self.dialer.display.send_display_command("DISP:8888")
-            self.dialer.display.send_display_command("LED:nack")
-            utils.sleep(0.3)
-            self.dialer.display.send_display_command("LED:nack")
-            utils.sleep(0.3)
-            self.dialer.display.send_display_command("LED:nack")
-            utils.sleep(0.3)
-            self.dialer.display.send_display_command("LED:nack")
-            utils.sleep(0.3)
-            self.dialer.display.send_display_command("LED:nack")
-            utils.sleep(0.3)
-            self.dialer.display.send_display_command("LED:nack")
-            utils.sleep(0.3)
-            self.dialer.display.send_display_command("LED:nack")
-            utils.sleep(0.3)
-            self.dialer.display.send_display_command("DISP:DUNO")
-            utils.sleep(1.3)
-            print("💥 404 error displayed")
-        except Exception as e:
-            print(f"⚠️ 404 error display failed: {e}")
+        send = self.dialer.display.send_display_command
+        sleep = utils.sleep
+        send("LED:nack")
+        send("DISP:404")
+        sleep(1.1)
+        send("LED:nack")
+        send("DISP:huh")
+        sleep(1.4)
+        send("LED:nack")
+        send("DISP:.404")
+        sleep(1)
+        send("LED:ack")
+        send("DISP:.huh")
+        sleep(1.4)
+        send("LED:nack")
+        send("DISP:.404")
+        sleep(1.4)
+        send("LED:nack")
+        send("DISP:8888")
+        send("LED:nack")
+        sleep(0.3)
+        send("LED:nack")
+        sleep(0.3)
+        send("LED:nack")
+        sleep(0.3)
+        send("LED:nack")
+        sleep(0.3)
+        send("LED:nack")
+        sleep(0.3)
+        send("LED:nack")
+        sleep(0.3)
+        send("LED:nack")
+        sleep(0.3)
+        send("DISP:DUNO")
+        sleep(1.3)
+        print("💥 404 error displayed")
 
     def digital_analog_effect(self):
         """DIGITAL_ANALOG - Digital/Analog visual effect (instant)"""
         print("✨ Digital/Analog effect activated")
-        try:
-            self.dialer.display.send_display_command("LED:matrix 20")
-            send_key_to_mpv('d')
-        except Exception as e:
-            print(f"⚠️ Digital/Analog effect failed: {e}")
+        self.dialer.display.send_display_command("LED:matrix 20")
+        send_key_to_mpv('d')
 
     def celestial_mode(self):
         """6969 - Random celestial object selector (instant)"""
@@ -256,15 +242,14 @@ class EasterEggActions:
         selected_object = random.choice(celestial_objects)
         print(f"🌌 Celestial mode activated - Selected: {selected_object}")
 
-        try:
-            # Show selection with cosmic LED effect
-            self.dialer.display.send_display_command("LED:pulse-blue 7")
-            utils.sleep(1.3)
-            self.dialer.display.send_display_command(f"DISP:{selected_object}")
-            utils.sleep(4.7)
-            print(f"🌌 Displaying celestial object: {selected_object}")
-        except Exception as e:
-            print(f"⚠️ Celestial mode failed: {e}")
+        send = self.dialer.display.send_display_command
+        sleep = utils.sleep
+        # Show selection with cosmic LED effect
+        send("LED:pulse-blue 7")
+        sleep(1.3)
+        send(f"DISP:{selected_object}")
+        sleep(4.7)
+        print(f"🌌 Displaying celestial object: {selected_object}")
 
     def magic_8_ball(self):
         """8888 - Magic 8 Ball with random responses (instant)"""
@@ -277,117 +262,96 @@ class EasterEggActions:
         selected_response = random.choice(responses)
         print(f"🎱 Magic 8 Ball activated - Response: {selected_response}")
 
-        try:
-            # Show thinking animation
-            self.dialer.display.send_display_command("LED:thinking 3")
-            self.dialer.display.send_display_command("DISP:8888")
-            utils.sleep(3)
-            # Show the response
-            self.dialer.display.send_display_command(f"DISP:{selected_response}")
-            print(f"🎱 Magic 8 Ball says: {selected_response}")
-            utils.sleep(3)
-        except Exception as e:
-            print(f"⚠️ Magic 8 Ball failed: {e}")
+        send = self.dialer.display.send_display_command
+        sleep = utils.sleep
+        # Show thinking animation
+        send("LED:thinking 3")
+        send("DISP:8888")
+        sleep(3)
+        # Show the response
+        send(f"DISP:{selected_response}")
+        print(f"🎱 Magic 8 Ball says: {selected_response}")
+        sleep(3)
 
     def clear_effects(self):
         """CLEAR - Clear effects (instant)"""
         print("✨ Clear effects activated")
-        try:
-            self.dialer.display.send_display_command("LED:ack")
-            send_key_to_mpv('h')
-        except Exception as e:
-            print(f"⚠️ Clear effects failed: {e}")
+        self.dialer.display.send_display_command("LED:ack")
+        send_key_to_mpv('h')
+
+class _Spec:
+    """Easter egg definition - slotted so lookups on the trigger path are plain attribute reads"""
+    __slots__ = ("message", "display", "action", "cleanup", "cooldown", "duration", "description", "cooldown_key")
+
+    def __init__(self, message, display, action, cooldown, description, cleanup=None, duration=None, cooldown_key=None):
+        self.message = message
+        self.display = display
+        self.action = action
+        self.cleanup = cleanup
+        self.cooldown = cooldown
+        self.duration = duration
+        self.description = description
+        self.cooldown_key = cooldown_key  # Shared cooldown id for aliased sequences
+
+# Built-in Easter eggs, shared by every registry:
+# sequence -> (message, display, action method, cooldown s, effect duration s,
+#              cleanup effect, description, shared cooldown id)
+_EGG_TABLE = {
+    "911": ("🚨 EMERGENCY!", "SHIT", "emergency_mode", 3600, 10, "emergency",
+            "Emergency mode (10s active, 1h cooldown)", None),
+    "666": ("😈 DEMON MODE!", "666", "demon_mode", 1800, 300, "demon",
+            "Demon mode (5m active, 30m cooldown)", None),
+    "420": ("🎉 PARTY TIME!", "YAH", "party_time", 2520, 1200, "party",
+            "Party mode (20m active, 42m cooldown)", None),
+    "1234": ("🧪 TEST MODE! (aka reset)", " RST", "full_reset", 2, None, None,
+             "Test mode (aka reset) (instant, 2s cooldown)", None),
+    "0000": ("🔄 RESET!", "RST", "full_reset", 2, None, None,
+             "Full reset (instant, 2s cooldown)", None),
+    "404": ("💥 ERROR!", "404", "show_404_error", 60, None, None,
+            "404 error (instant, 1m cooldown)", None),
+    "6969": ("🌌 Celestial mode!", "STAR", "celestial_mode", 20, None, None,
+             "Random celestial object (instant, 30s cooldown)", "celestial"),
+    "8888": ("🎱 Magic 8 Ball!", "8888", "magic_8_ball", 5, None, None,
+             "Magic 8 Ball (instant, 5s cooldown)", None),
+    "DIGITAL_ANALOG": ("✨ Digital/Analog effect!", "8bit", "digital_analog_effect", 2, None, None,
+                       "Digital/Analog effect (instant, 2s cooldown)", None),
+    "CLEAR": ("✨ Clear effects!", "RTN", "clear_effects", 2, None, None,
+              "Clear effects (instant, 2s cooldown)", None),
+}
+# Alias -> sequence whose spec (and so cooldown) it shares
+_EGG_ALIASES = {"9696": "6969"}
 
 class EasterEggRegistry:
     """Enhanced registry with cooldown and expiration support"""
+    __slots__ = ("actions", "_registry", "_prefix_set")
 
     def __init__(self, actions):
         self.actions = actions
-        self._registry = {
-            "911": {
-                "message": "🚨 EMERGENCY!",
-                "display": "SHIT",
-                "action": self.actions.emergency_mode,
-                "cleanup": self.actions._cleanup_emergency_mode,
-                "cooldown": 3600, # 1 hour cooldown
-                "duration": 10,
-                "description": "Emergency mode (10s active, 1h cooldown)"
-            },
-            "666": {
-                "message": "😈 DEMON MODE!",
-                "display": "666",
-                "action": self.actions.demon_mode,
-                "cleanup": self.actions._cleanup_demon_mode,
-                "cooldown": 1800, # 30 min cooldown
-                "duration": 300,  # 5 minutes active
-                "description": "Demon mode (5m active, 30m cooldown)"
-            },
-            "420": {
-                "message": "🎉 PARTY TIME!",
-                "display": "YAH",
-                "action": self.actions.party_time,
-                "cleanup": self.actions._cleanup_party_time,
-                "cooldown": 2520,  # 42 min cooldown
-                "duration": 1200,  # 20 minutes active
-                "description": "Party mode (20m active, 42m cooldown)"
-            },
-            "1234": {
-                "message": "🧪 TEST MODE! (aka reset)",
-                "display": " RST",
-                "action": self.actions.full_reset,
-                "cooldown": 2,
-                "description": "Test mode (aka reset) (instant, 2s cooldown)"
-            },
-            "0000": {
-                "message": "🔄 RESET!",
-                "display": "RST",
-                "action": self.actions.full_reset,
-                "cooldown": 2,
-                "description": "Full reset (instant, 2s cooldown)"
-            },
-            "404": {
-                "message": "💥 ERROR!",
-                "display": "404",
-                "action": self.actions.show_404_error,
-                "cooldown": 60,    # 1 min cooldown
-                "description": "404 error (instant, 1m cooldown)"
-            },
-            "6969": {
-                "message": "🌌 Celestial mode!",
-                "display": "STAR",
-                "action": self.actions.celestial_mode,
-                "cooldown": 20,    # 30 second cooldown
-                "description": "Random celestial object (instant, 30s cooldown)"
-            },
-            "9696": {
-                "message": "🌌 Celestial mode!",
-                "display": "STAR",
-                "action": self.actions.celestial_mode,
-                "cooldown": 20,    # 30 second cooldown
-                "description": "Random celestial object (instant, 30s cooldown)"
-            },
-            "8888": {
-                "message": "🎱 Magic 8 Ball!",
-                "display": "8888",
-                "action": self.actions.magic_8_ball,
-                "cooldown": 5, # 5 second cooldown
-                "description": "Magic 8 Ball (instant, 5s cooldown)"
-            },
-            "DIGITAL_ANALOG": {
-                "message": "✨ Digital/Analog effect!",
-                "display": "8bit",
-                "action": self.actions.digital_analog_effect,
-                "cooldown": 2,     # 2 second cooldown
-                "description": "Digital/Analog effect (instant, 2s cooldown)"
-            },
-            "CLEAR": {
-                "message": "✨ Clear effects!",
-                "display": "RTN",
-                "action": self.actions.clear_effects,
-                "cooldown": 2,     # 2 second cooldown
-                "description": "Clear effects (instant, 2s cooldown)"
-            },
-        }
+        self._registry = {}
+        for sequence, (message, display, action, cooldown, duration, cleanup, description, cooldown_key) in _EGG_TABLE.items():
+            self._registry[sequence] = _Spec(
+                message=message,
+                display=display,
+                action=getattr(actions, action),
+                cleanup=partial(actions._cleanup, cleanup) if cleanup else None,
+                cooldown=cooldown,
+                duration=duration,
+                description=description,
+                cooldown_key=cooldown_key
+            )
+        for alias, sequence in _EGG_ALIASES.items():
+            self._registry[alias] = self._registry[sequence]
+        self._rebuild_prefixes()
+
+    def _rebuild_prefixes(self):
+        """Precompute every prefix of every registered sequence"""
+        self._prefix_set = frozenset(
+            seq[:i] for seq in self._registry for i in range(1, len(seq) + 1)
+        )
+
+    def might_match(self, prefix):
+        """Check if prefix could still grow into an Easter egg sequence"""
+        return prefix in self._prefix_set
 
     def get_easter_egg(self, sequence):
         """Get Easter egg configuration for sequence"""
@@ -402,11 +366,12 @@ class EasterEggRegistry:
         config = self.get_easter_egg(sequence)
         if not config:
             return False
+        cooldown_id = config.cooldown_key or sequence
 
         # Check if on cooldown
-        if not dialer.cooldown_manager.can_activate(sequence, config["cooldown"]):
+        if not dialer.cooldown_manager.can_activate(cooldown_id, config.cooldown):
             dialer.display.send_display_command("LED:nack")
-            remaining = dialer.cooldown_manager.get_time_until_available(sequence, config["cooldown"])
+            remaining = dialer.cooldown_manager.get_time_until_available(cooldown_id, config.cooldown)
             minutes = remaining // 60
             seconds = remaining % 60
             if minutes > 0:
@@ -420,26 +385,26 @@ class EasterEggRegistry:
             return False
 
         # Display the message and show on display
-        print(config["message"])
-        if "display" in config:
+        print(config.message)
+        if config.display:
             try:
-                dialer.display.send_display_command(f"DISP:{config['display']}")
+                dialer.display.send_display_command(f"DISP:{config.display}")
             except Exception as e:
                 print(f"⚠️ Display update failed: {e}")
 
         # Activate the easter egg in the cooldown manager
         dialer.cooldown_manager.activate_easter_egg(
-            sequence, 
-            config["cooldown"], 
-            config.get("duration"), 
-            config.get("cleanup")
+            cooldown_id, 
+            config.cooldown, 
+            config.duration, 
+            config.cleanup
         )
 
-        # Execute the action
+        # Execute the action - the single place action errors are caught
         try:
-            config["action"]()
+            config.action()
         except Exception as e:
-            print(f"⚠️ Easter egg action failed: {e}")
+            print(f"⚠️ Easter egg {sequence} action failed: {e}")
             # If action failed, we should still respect the cooldown
 
         return True
@@ -448,12 +413,13 @@ class EasterEggRegistry:
         """Get status information about all easter eggs"""
         status = {}
         for egg_id, config in self._registry.items():
-            remaining_cooldown = dialer.cooldown_manager.get_time_until_available(egg_id, config["cooldown"])
-            remaining_effect = dialer.cooldown_manager.get_effect_time_remaining(egg_id)
-            is_active = dialer.cooldown_manager.is_effect_active(egg_id)
+            cooldown_id = config.cooldown_key or egg_id
+            remaining_cooldown = dialer.cooldown_manager.get_time_until_available(cooldown_id, config.cooldown)
+            remaining_effect = dialer.cooldown_manager.get_effect_time_remaining(cooldown_id)
+            is_active = dialer.cooldown_manager.is_effect_active(cooldown_id)
 
             status[egg_id] = {
-                "description": config["description"],
+                "description": config.description,
                 "cooldown_remaining": remaining_cooldown,
                 "effect_remaining": remaining_effect,
                 "is_active": is_active,
@@ -463,14 +429,15 @@ class EasterEggRegistry:
 
     def add_easter_egg(self, sequence, message, display, action_func, cooldown=60):
         """Add a custom Easter egg at runtime"""
-        self._registry[sequence] = {
-            "message": message,
-            "display": display,
-            "action": action_func,
-            "cooldown": cooldown,
-            "description": f"Custom Easter egg ({cooldown}s cooldown)"
-        }
+        self._registry[sequence] = _Spec(
+            message=message,
+            display=display,
+            action=action_func,
+            cooldown=cooldown,
+            description=f"Custom Easter egg ({cooldown}s cooldown)"
+        )
+        self._rebuild_prefixes()
 
     def list_easter_eggs(self):
         """List all available Easter eggs"""
-        return {seq: config["description"] for seq, config in self._registry.items()}
+        return {seq: config.description for seq, config in self._registry.items()}
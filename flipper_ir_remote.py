@@ -6,26 +6,46 @@ Maps IR signals to standardized events with intelligent digit queue system and d
 
 import serial
 import sys
+import atexit
 import re
 import json
 import os
 import subprocess
 import threading
+import queue
+import selectors
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
 
 # Import our modular components
 from display_controller import DisplayController
-from display_queue import DisplayQueue
+from display_queue import DisplayQueue, Ring
 from channel_dialer import ChannelDialer, VALID_CHANNELS
 
 # Import shared utilities
 import utils
-from utils import safe_execute, send_key_to_mpv, write_json_to_socket, get_now, start_timer
+from utils import send_key_to_mpv, write_json_to_socket, get_now, get_monotonic
 
 # Make paths portable
 BASE_RUNTIME_PATH = os.environ.get("FIELDSTATION_RUNTIME", "runtime")
 SOCKET_PATH = os.path.join(BASE_RUNTIME_PATH, "channel.socket")
 LOG_PATH = os.path.join(BASE_RUNTIME_PATH, "ir_mapper.log")
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 5.0
+READ_WAIT_TIMEOUT = 60  # Max seconds the selector blocks before the loop spins once
+READ_CHUNK = 65536  # One os.read() takes everything the tty has buffered
+RX_QUEUE_CAPACITY = 1024  # Lines buffered between the reader thread and dispatch
+# usb-serial adapters (FTDI etc.) hold bytes up to latency_timer ms before handing them over
+USB_SERIAL_SYSFS = "/sys/bus/usb-serial/devices"
+
+# Flipper "ir rx" output, e.g. b"NEC, A:0x32, C:0x11" - matched on raw bytes
+_IR_RE = re.compile(rb'(\w+), A:(0x[0-9A-Fa-f]+), C:(0x[0-9A-Fa-f]+)')
+# Every decoded IR line contains this; CLI chatter ('ir rx', 'Receiving...', 'Press Ctrl+C')
+# never does, so one substring scan filters it before the regex runs
+_IR_MARKER = b', A:0x'
 
 # Enhanced remote configurations with more button mappings
 REMOTE_CONFIGS = {
@@ -112,11 +132,53 @@ REMOTE_CONFIGS = {
     },
 }
 
+# Digit press log lines, built once rather than formatted on every press
+_DIGIT_MSGS = tuple(f"{d}️⃣ Digit {d}" for d in range(10))
+
+class EventKind(IntEnum):
+    """How an IR signal resolved against REMOTE_CONFIGS"""
+    MAPPED = 0    # Known remote, known button
+    UNMAPPED = 1  # Known remote, unknown button
+    UNKNOWN = 2   # Unknown remote
+
+@lru_cache(maxsize=256)
+def _hex_int(value):
+    """'0x0A' / '0x0a' / '0x00A' -> 10, so case and padding never cause a lookup miss"""
+    return int(value, 16)
+
+# Flattened lookup tables built once from REMOTE_CONFIGS
+#   _IR_INDEX:    (protocol, address, command) -> (event, remote_name)
+#   _REMOTE_KEYS: (protocol, address) -> remote_name, for UNMAPPED fallback
+# Address and command are ints parsed from the hex; protocol and event strings are interned.
+_IR_INDEX = {}
+_REMOTE_KEYS = {}
+for _remote_name, _config in REMOTE_CONFIGS.items():
+    _remote_key = (sys.intern(_config["protocol"]), _hex_int(_config["address"]))
+    if _remote_key in _REMOTE_KEYS:
+        continue  # First remote claiming a protocol/address wins
+    _REMOTE_KEYS[_remote_key] = _remote_name
+    for _command, _event in _config["mappings"].items():
+        _IR_INDEX[_remote_key + (_hex_int(_command),)] = (sys.intern(_event), _remote_name)
+
+@lru_cache(maxsize=256)
+def _unmapped_name(remote_name, command):
+    """UNMAPPED_ event name - cached so repeats return the same interned object"""
+    return sys.intern(f"UNMAPPED_{remote_name}_0x{command:02X}")
+
+@lru_cache(maxsize=256)
+def _unknown_name(protocol, address, command):
+    """UNKNOWN_ event name - bounded cache so a noisy foreign remote stops allocating"""
+    return sys.intern(f"UNKNOWN_{protocol}_0x{address:02X}_0x{command:02X}")
+
 class IRRemoteMapper:
     """Main IR Remote Mapper class that coordinates everything"""
     
     def __init__(self, args):
         self.args = args
+        # Flags read for every IR line, copied off the argparse Namespace once
+        self._debug = args.debug
+        self._debounce = args.debounce
+        self._verbose_unknowns = args.verbose_unknowns
 
         # set up logging early...
         self.log_file = None
@@ -126,25 +188,74 @@ class IRRemoteMapper:
         self.display_controller = None
         self.channel_dialer = None
         self.flipper = None
+        self._rx_buf = bytearray()  # Partial serial data carried between reads
+        self._flipper_fd = None     # Read directly once the selector reports it ready
+        self._selector = None       # Waits on the Flipper fd when the port has one
+
+        # Lines handed from the reader thread to dispatch; oldest dropped if dispatch stalls
+        self._rx_ring = Ring(RX_QUEUE_CAPACITY)
+        self._rx_cond = threading.Condition()
+        self._rx_error = None
+        self.rx_dropped = 0
         
         # Event state
         self.last_event = None
         self.last_event_time = 0
+        self._debounce_deadline = 0  # last_event_time + debounce, precomputed
+        self._last_raw = None        # Matched bytes of the last dispatched signal
         
+        # Socket commands - ours and the dialer's - are written by one background thread,
+        # off the IR loop; a single writer keeps them in order since each write replaces the last
+        self._sock_q = queue.SimpleQueue()
+        threading.Thread(target=self._socket_writer, daemon=True).start()
+
         # Initialize components
         self._setup_display()
         self._setup_channel_dialer()
         self._setup_event_handlers()
         self.display_queue = DisplayQueue(self.display_controller)
         self.display_queue.start()
+
+        # Key sends may fall back to forking xdotool - run them on a single worker so keys stay ordered
+        self._mpv_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mpv")
     
+    def _socket_writer(self):
+        """Drain queued socket commands in order"""
+        while True:
+            write_json_to_socket(self._sock_q.get())
+
+    def _send_key(self, key):
+        """Send a key to MPV without blocking the IR loop"""
+        self._mpv_executor.submit(send_key_to_mpv, key)
+
     def _setup_logging(self):
         """Setup logging if requested"""
         if self.args.log_to_file:
             os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
-            self.log_file = open(LOG_PATH, 'a')
+            # Point fds 1/2 at the log so xdotool and other children log there too
+            fd = os.open(LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            os.dup2(fd, 1)
+            os.dup2(fd, 2)
+            os.close(fd)
+            # One large buffer for both streams so print() rarely hits the disk and output
+            # stays in order; flushed on a timer and at exit
+            self.log_file = os.fdopen(1, 'w', buffering=LOG_BUFFER_SIZE)
             sys.stdout = self.log_file
             sys.stderr = self.log_file
+            atexit.register(self._flush_log)
+            threading.Thread(target=self._log_flusher, daemon=True).start()
+
+    def _flush_log(self):
+        try:
+            self.log_file.flush()
+        except ValueError:
+            pass  # Already closed
+
+    def _log_flusher(self):
+        """Periodically push buffered log output to disk"""
+        while not self.log_file.closed:
+            utils.sleep(LOG_FLUSH_INTERVAL)
+            self._flush_log()
     
     def _setup_display(self):
         """Initialize display controller"""
@@ -157,12 +268,14 @@ class IRRemoteMapper:
         """Initialize channel dialer with display"""
         self.channel_dialer = ChannelDialer(
             digit_timeout=self.args.digit_timeout,
-            display_controller=self.display_controller
+            display_controller=self.display_controller,
+            send_command=self._sock_q.put
         )
     
     def _setup_event_handlers(self):
-        """Setup event handler mappings"""
-        self.event_handlers = {
+        """Setup event handler mappings (read-only once built)"""
+        # DIGIT_0..DIGIT_9 are dispatched directly in handle_event
+        self.event_handlers = MappingProxyType({
             'CHANNEL_UP': self._handle_channel_up,
             'CHANNEL_DOWN': self._handle_channel_down,
             'EFFECT_NEXT': self._handle_effect_next,
@@ -176,19 +289,9 @@ class IRRemoteMapper:
             'MENU': self._handle_menu,
             'OK': self._handle_ok,
             'BACK': self._handle_back,
-            'DIGIT_0': lambda: self._handle_digit(0),
-            'DIGIT_1': lambda: self._handle_digit(1),
-            'DIGIT_2': lambda: self._handle_digit(2),
-            'DIGIT_3': lambda: self._handle_digit(3),
-            'DIGIT_4': lambda: self._handle_digit(4),
-            'DIGIT_5': lambda: self._handle_digit(5),
-            'DIGIT_6': lambda: self._handle_digit(6),
-            'DIGIT_7': lambda: self._handle_digit(7),
-            'DIGIT_8': lambda: self._handle_digit(8),
-            'DIGIT_9': lambda: self._handle_digit(9),
             'DIGITAL_ANALOG': self._handle_digital_analog,
             'CLEAR': self._handle_clear_mode,
-        }
+        })
     
     def _boot_sequence(self):
         """Show boot sequence on display"""
@@ -210,67 +313,59 @@ class IRRemoteMapper:
     def _handle_effect_next(self):
         print("✨ Next effect!")
         if self.display_controller:
-            self.display_controller.display_text("EFuP")
-            start_timer(0.5, lambda: self.display_controller.display_number(self.channel_dialer.current_channel))
-        send_key_to_mpv('c')
+            self.channel_dialer.flash("EFuP", 0.5)
+        self._send_key('c')
     
     def _handle_effect_prev(self):
         print("✨ Previous effect!")
         if self.display_controller:
-            self.display_controller.display_text("EFdn")
-            start_timer(0.5, lambda: self.display_controller.display_number(self.channel_dialer.current_channel))
-        send_key_to_mpv('z')
+            self.channel_dialer.flash("EFdn", 0.5)
+        self._send_key('z')
     
     def _handle_volume_up(self):
         print("🔊 Volume UP!")
-        send_key_to_mpv('0')
+        self._send_key('0')
     
     def _handle_volume_down(self):
         print("🔉 Volume DOWN!")
-        send_key_to_mpv('9')
+        self._send_key('9')
     
     def _handle_mute(self):
         print("🔇 Mute toggle!")
-        send_key_to_mpv('m')
+        self._send_key('m')
     
     def _handle_power(self):
         print("⚡ Power toggle!")
         if self.display_controller:
-            self.display_controller.clear_display()
-            utils.sleep(0.5)
-            self.display_controller.display_number(self.channel_dialer.current_channel)
-        write_json_to_socket({"command": "power_toggle", "timestamp": get_now()})
+            self.channel_dialer.flash(None, 0.5)
+        self._sock_q.put({"command": "power_toggle", "timestamp": get_now()})
     
     def _handle_pause(self):
         print("⏸️  Pause/Play toggle!")
-        send_key_to_mpv('space')
+        self._send_key('space')
     
     def _handle_info(self):
         print("ℹ️  Info display!")
         if self.display_controller:
-            self.display_controller.display_text("INFO")
-            utils.sleep(1.5)
-            self.display_controller.display_number(self.channel_dialer.current_channel)
-        write_json_to_socket({"command": "info", "timestamp": get_now()})
+            self.channel_dialer.flash("INFO", 1.5)
+        self._sock_q.put({"command": "info", "timestamp": get_now()})
     
     def _handle_menu(self):
         print("📋 Menu!")
         if self.display_controller:
-            self.display_controller.display_text("MENU")
-            utils.sleep(1.5)
-            self.display_controller.display_number(self.channel_dialer.current_channel)
-        write_json_to_socket({"command": "menu", "timestamp": get_now()})
+            self.channel_dialer.flash("MENU", 1.5)
+        self._sock_q.put({"command": "menu", "timestamp": get_now()})
     
     def _handle_ok(self):
         print("✅ OK/Select!")
-        send_key_to_mpv('Return')
+        self._send_key('Return')
     
     def _handle_back(self):
         print("⬅️  Back!")
-        write_json_to_socket({"command": "back", "timestamp": get_now()})
+        self._sock_q.put({"command": "back", "timestamp": get_now()})
     
     def _handle_digit(self, digit):
-        print(f"{digit}️⃣ Digit {digit}")
+        print(_DIGIT_MSGS[digit])
         self.channel_dialer.add_digit(digit)
     
     def _handle_digital_analog(self):
@@ -289,32 +384,165 @@ class IRRemoteMapper:
     def _handle_unknown_event(self, event_name):
         print(f"❌ Unknown event: {event_name}")
     
-    def handle_event(self, event_name, protocol=None, address=None, command=None):
+    def handle_event(self, event_name, protocol=None, address=None, command=None, kind=None):
         """Handle an IR event"""
-        if event_name.startswith("UNMAPPED_"):
+        if kind is None:
+            # Callers without a classification fall back to the name prefix (one slice, two compares)
+            prefix = event_name[:8]
+            if prefix == "UNMAPPED":
+                kind = EventKind.UNMAPPED
+            elif prefix == "UNKNOWN_":
+                kind = EventKind.UNKNOWN
+            else:
+                kind = EventKind.MAPPED
+
+        if kind == EventKind.UNMAPPED:
             self._handle_unmapped_event(event_name)
-        elif event_name.startswith("UNKNOWN_"):
+        elif kind == EventKind.UNKNOWN:
             self._handle_unknown_event(event_name)
+        elif event_name[:6] == 'DIGIT_' and len(event_name) == 7 and '0' <= event_name[6] <= '9':
+            # Hottest event type: the digit is the last character of the name
+            self._handle_digit(ord(event_name[6]) - 48)
         else:
             handler = self.event_handlers.get(event_name)
             if handler:
                 handler()
             else:
                 print(f"⚠️  No handler for event: {event_name}")
-                write_json_to_socket({"command": "no_handler", "event": event_name})
+                self._sock_q.put({"command": "no_handler", "event": event_name})
 
-        if self.args.verbose_unknowns and protocol and address and command:
+        if self._verbose_unknowns and protocol and address and command:
             print(f"🔍 Raw IR: protocol={protocol}, address={address}, command={command}")
 
+    def classify_ir_signal(self, protocol, address, command):
+        """Map IR signal to (EventKind, event name)"""
+        address = _hex_int(address)
+        command = _hex_int(command)
+        hit = _IR_INDEX.get((protocol, address, command))
+        if hit:
+            return EventKind.MAPPED, hit[0]
+
+        remote_name = _REMOTE_KEYS.get((protocol, address))
+        if remote_name:
+            return EventKind.UNMAPPED, _unmapped_name(remote_name, command)
+        return EventKind.UNKNOWN, _unknown_name(protocol, address, command)
+
     def map_ir_signal(self, protocol, address, command):
         """Map IR signal to event name"""
-        for remote_name, config in REMOTE_CONFIGS.items():
-            if config["protocol"] == protocol and config["address"] == address:
-                if command in config["mappings"]:
-                    return config["mappings"][command], protocol, address, command
-                else:
-                    return f"UNMAPPED_{remote_name}_{command}", protocol, address, command
-        return f"UNKNOWN_{protocol}_{address}_{command}", protocol, address, command
+        _, event = self.classify_ir_signal(protocol, address, command)
+        return event, protocol, address, command
+
+    def _enable_low_latency(self):
+        """Ask the tty driver to deliver bytes immediately instead of batching them"""
+        try:
+            self.flipper.set_low_latency_mode(True)  # ASYNC_LOW_LATENCY via TIOCSSERIAL
+            print("⚡ Flipper tty: ASYNC_LOW_LATENCY enabled")
+            return
+        except (AttributeError, ValueError, OSError) as e:
+            print(f"⚠️  ASYNC_LOW_LATENCY unavailable: {e}")
+
+        tty = os.path.basename(os.path.realpath(self.args.device))
+        latency_path = os.path.join(USB_SERIAL_SYSFS, tty, "latency_timer")
+        try:
+            with open(latency_path, 'w') as f:
+                f.write("1")
+            print(f"⚡ Flipper tty: {latency_path} set to 1ms")
+        except OSError:
+            pass  # Not a usb-serial adapter (e.g. CDC-ACM) or no permission - nothing to tune
+
+    def _watch_flipper(self, fd):
+        """Register the Flipper fd once with the platform's best selector (epoll on Linux)"""
+        self._flipper_fd = fd
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(fd, selectors.EVENT_READ)
+
+    def _read_lines(self):
+        """Read everything the Flipper has buffered and return the complete lines"""
+        if self._selector:
+            # Sleep in the kernel until bytes arrive instead of waking on read timeouts
+            if not self._selector.select(READ_WAIT_TIMEOUT):
+                return []
+            # Ready fd: a single read() syscall, skipping pyserial's in_waiting ioctl and select
+            try:
+                chunk = os.read(self._flipper_fd, READ_CHUNK)
+            except BlockingIOError:
+                return []  # Spurious wakeup on the O_NONBLOCK tty - nothing to read yet
+            if not chunk:
+                raise OSError("Flipper disconnected (readable but no data)")
+        else:
+            chunk = self.flipper.read(max(1, self.flipper.in_waiting))
+            if not chunk:
+                return []
+        self._rx_buf.extend(chunk)
+
+        end = self._rx_buf.rfind(b'\n')
+        if end < 0:
+            return []
+        lines = self._rx_buf[:end].split(b'\n')
+        del self._rx_buf[:end + 1]
+        return lines
+
+    def _reader_loop(self):
+        """Producer: keep draining the port even while a handler is busy"""
+        # Hot-loop lookups are bound to locals once, as in run()
+        read_lines = self._read_lines
+        push = self._rx_ring.push
+        cond = self._rx_cond
+        try:
+            while True:
+                lines = read_lines()
+                if not lines:
+                    continue
+                with cond:
+                    for line in lines:
+                        if not push(line):
+                            self.rx_dropped += 1
+                    cond.notify()
+        except Exception as e:
+            # Hand the failure (e.g. Flipper unplugged) to the dispatch loop
+            with self._rx_cond:
+                self._rx_error = e
+                self._rx_cond.notify()
+
+    def _take_lines(self):
+        """Consumer: wait for lines from the reader thread and take all of them"""
+        ring = self._rx_ring
+        with self._rx_cond:
+            self._rx_cond.wait_for(lambda: len(ring) or self._rx_error, timeout=READ_WAIT_TIMEOUT)
+            if not len(ring) and self._rx_error:
+                raise self._rx_error  # Only once everything read before the failure is handled
+            return [ring.pop() for _ in range(len(ring))]
+
+    def _process_line(self, line):
+        """Parse one line (bytes) of Flipper output and dispatch any IR event in it"""
+        if self._debug:
+            print(f"DEBUG: '{line.decode('utf-8', errors='replace')}'")
+        if _IR_MARKER not in line:
+            return
+
+        ir_match = _IR_RE.match(line)
+        if not ir_match:
+            return
+
+        # A held button repeats the exact same signal - drop it before decoding or mapping
+        raw = ir_match.group(0)
+        current_time = get_monotonic()
+        if raw == self._last_raw and current_time < self._debounce_deadline:
+            return
+
+        # Only the three captured fields are ever decoded
+        protocol, address, command = (sys.intern(g.decode('ascii')) for g in ir_match.groups())
+        kind, event = self.classify_ir_signal(protocol, address, command)
+
+        # Different signals for the same event (e.g. two remotes) share the window
+        if event == self.last_event and current_time < self._debounce_deadline:
+            return
+
+        self.handle_event(event, protocol, address, command, kind=kind)
+        self._last_raw = raw
+        self.last_event = event
+        self.last_event_time = current_time
+        self._debounce_deadline = current_time + self._debounce
 
     def run(self):
         """Main run loop"""
@@ -335,6 +563,12 @@ class IRRemoteMapper:
 
             self.flipper.write(b'ir rx\r\n')
 
+            # Real ports: the selector does the waiting, reads never block (mocks keep the timeout)
+            if hasattr(self.flipper, 'fileno'):
+                self._watch_flipper(self.flipper.fileno())
+                self.flipper.timeout = 0
+                self._enable_low_latency()
+
             # Startup messages
             print(f"Enhanced IR Remote Mapper ready on {self.args.device}...")
             print(f"Writing JSON to: {SOCKET_PATH}")
@@ -347,44 +581,37 @@ class IRRemoteMapper:
                 self.display_queue.sleep(0.5)
                 self.display_queue.show_number(self.channel_dialer.current_channel)
 
-            while True:
-                line = self.flipper.readline().decode('utf-8').strip()
-                if not line:
-                    continue
-                if self.args.debug:
-                    print(f"DEBUG: '{line}'")
-                if any(line.startswith(h) for h in ('ir rx', 'Receiving', 'Press Ctrl+C')):
-                    continue
+            # Reads run on their own thread so slow handlers never leave bytes in the tty
+            threading.Thread(target=self._reader_loop, daemon=True).start()
 
-                ir_match = re.match(r'(\w+), A:(0x[0-9A-Fa-f]+), C:(0x[0-9A-Fa-f]+)', line)
-                if ir_match:
-                    protocol, address, command = ir_match.groups()
-                    event, proto, addr, cmd = self.map_ir_signal(protocol, address, command)
-                    current_time = get_now()
-
-                    if event != self.last_event or (current_time - self.last_event_time) >= self.args.debounce:
-                        self.handle_event(event, proto, addr, cmd)
-                        self.last_event = event
-                        self.last_event_time = current_time
+            # Hot-loop methods are bound to locals once
+            take_lines = self._take_lines
+            process_line = self._process_line
+            while True:
+                for raw in take_lines():
+                    line = raw.strip()
+                    if line:
+                        process_line(line)
 
         except KeyboardInterrupt:
             print("\nMapper stopped")
             self.channel_dialer.clear_queue()  # Clean up any pending timers
             if self.display_controller and self.display_controller.display_serial:
-                self.display_controller.display_text("BYE")
-                utils.sleep(1)
-                self.display_controller.clear_display()
+                # Farewell runs on the display worker, behind any in-flight frames
+                self.display_queue.stop("BYE", final_clear=True)
         except Exception as e:
             print(f"Error: {e}")
         finally:
             try:
+                if self._selector:
+                    self._selector.close()
                 if self.flipper:
                     self.flipper.close()
             except:
                 pass
             try:
-                if self.display_controller and self.display_controller.display_serial:
-                    self.display_controller.display_serial.close()
+                if self.display_controller:
+                    self.display_controller.close()  # Sends the queued farewell first
             except:
                 pass
             if self.log_file:
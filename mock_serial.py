@@ -8,6 +8,7 @@ class MockSerial:
         self.baudrate = baudrate
         self.timeout = timeout
         self.is_open = True
+        self._pending = b""  # Simulated bytes sitting in the OS receive buffer
         print(f"DEBUG [MockSerial]: Connected to {port} @ {baudrate}")
 
     def write(self, data):
@@ -24,6 +25,16 @@ class MockSerial:
         self.is_open = False
         print(f"DEBUG [MockSerial] {self.port} <CLOSE>")
 
+    @property
+    def in_waiting(self):
+        return len(self._pending)
+
+    def read(self, size=1):
+        if not self._pending:
+            self._pending = self.readline()
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
     def readline(self):
         # If this is the Flipper Zero device, we can simulate some IR signals
         if "ACM0" in self.port or "device" in self.port:
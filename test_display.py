@@ -4,6 +4,7 @@ import threading
 from unittest.mock import MagicMock
 import utils
 from display_queue import DisplayQueue
+from display_controller import DisplayController
 
 class MockDisplayController:
     def __init__(self):
@@ -66,5 +67,93 @@ class TestDisplayQueue(unittest.TestCase):
         self.assertGreaterEqual(self.virtual_time - start_time, 5.0)
         self.assertEqual(self.controller.received, [("text", "DONE")])
 
+    def test_stop_plays_farewell(self):
+        """Test that stop() drains queued frames and the farewell before exiting"""
+        self.dq.start()
+        self.dq.show_number(3)
+        self.dq.stop("BYE", final_clear=True)
+        self.assertEqual(self.controller.received, [("number", 3), ("text", "BYE"), ("clear", None)])
+
+    def test_overflow_drops_oldest(self):
+        """Test that a full queue drops its oldest command instead of growing"""
+        dq = DisplayQueue(self.controller, capacity=2)
+        dq.show_text("A")
+        dq.show_text("B")
+        dq.show_text("C")
+        self.assertEqual(len(dq.queue), 2)
+        self.assertEqual(dq.queue.pop(), ("text", "B"))
+        self.assertEqual(dq.queue.pop(), ("text", "C"))
+        self.dq.start()  # tearDown joins the worker
+
+class TestDisplayController(unittest.TestCase):
+    def setUp(self):
+        self.controller = DisplayController()
+        self.controller.display_serial = MagicMock()
+
+    def test_redundant_text_skipped(self):
+        """Test that re-sending the text already shown does not hit the serial port"""
+        self.controller.display_number("1")
+        self.controller.display_number(1)
+        self.controller.display_number("13")
+        self.assertEqual(self.controller.display_serial.write.call_count, 2)
+
+    def test_led_commands_not_skipped(self):
+        """Test that non-display commands are always sent"""
+        self.controller.send_display_command("LED:nack")
+        self.controller.send_display_command("LED:nack")
+        self.assertEqual(self.controller.display_serial.write.call_count, 2)
+
+    def test_batch_coalesced(self):
+        """Test that a drained batch keeps control commands and only the last text"""
+        self.controller._tx = ["DISP:1", "DISP:BRT:3", "DISP:12", "DISP:CLR", "DISP:123"]
+        self.controller._flush_tx()
+        self.controller.display_serial.write.assert_called_once_with(b"DISP:BRT:3\r\nDISP:123\r\n")
+        self.assertEqual(self.controller._last_displayed, "DISP:123")
+
+    def test_batch_drops_superseded_text(self):
+        """Test that text replaced within one batch is never written, even a brief flash"""
+        self.controller._tx = ["DISP:UP", "LED:ack", "DISP:2"]
+        self.controller._flush_tx()
+        self.controller.display_serial.write.assert_called_once_with(b"LED:ack\r\nDISP:2\r\n")
+
+    def test_control_command_resets_dedupe(self):
+        """Test that the same text is re-sent after the panel is turned off and on"""
+        self.controller.display_number(2)
+        self.controller.turn_off()
+        self.controller.turn_on()
+        self.controller.display_number(2)
+        self.controller.display_serial.write.assert_called_with(b"DISP:2\r\n")
+        self.assertEqual(self.controller.display_serial.write.call_count, 4)
+
+        # Within one batch too: the control command in between forces the resend
+        self.controller._tx = ["DISP:OFF", "DISP:ON", "DISP:2"]
+        self.controller._flush_tx()
+        self.controller.display_serial.write.assert_called_with(b"DISP:OFF\r\nDISP:ON\r\nDISP:2\r\n")
+
+    def test_writer_coalesces_burst(self):
+        """Test that a burst sent while the writer runs goes out as a single write"""
+        self.controller.start_writer()
+        self.controller.send_display_command("LED:ack")
+        self.controller.display_number(1)
+        self.controller.display_number(13)
+
+        deadline = time.time() + 2
+        while not self.controller.display_serial.write.called and time.time() < deadline:
+            time.sleep(0.01)
+        self.controller.display_serial.write.assert_called_once_with(b"LED:ack\r\nDISP:13\r\n")
+
+    def test_close_sends_pending(self):
+        """Test that close() writes commands still waiting for the writer before closing"""
+        serial_port = self.controller.display_serial
+        self.controller.start_writer()
+        self.controller.display_text("BYE")
+        self.controller.clear_display()
+        self.controller.close()
+
+        written = b"".join(c.args[0] for c in serial_port.write.call_args_list)
+        self.assertTrue(written.endswith(b"DISP:CLR\r\n"))
+        serial_port.close.assert_called_once()
+        self.assertIsNone(self.controller.display_serial)
+
 if __name__ == '__main__':
     unittest.main()
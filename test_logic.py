@@ -64,5 +64,16 @@ class TestChannelLogic(unittest.TestCase):
         self.dialer.channel_down()
         self.assertEqual(self.dialer.current_channel, 1)
 
+    def test_easter_egg_prefixes(self):
+        """Test that only sequences that can grow into an Easter egg are checked"""
+        registry = self.dialer.easter_registry
+        self.assertTrue(registry.might_match("9"))
+        self.assertTrue(registry.might_match("91"))
+        self.assertTrue(registry.might_match("911"))
+        self.assertFalse(registry.might_match("13"))
+
+        registry.add_easter_egg("135", "Custom!", "CUST", lambda: None)
+        self.assertTrue(registry.might_match("13"))
+
 if __name__ == '__main__':
     unittest.main()
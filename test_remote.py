@@ -1,9 +1,9 @@
 import unittest
 import time
 import os
-import re
 from unittest.mock import MagicMock, patch
-from flipper_ir_remote import IRRemoteMapper
+import utils
+from flipper_ir_remote import IRRemoteMapper, EventKind
 
 class MockArgs:
     def __init__(self):
@@ -35,28 +35,163 @@ class TestRemoteMapping(unittest.TestCase):
         event, proto, addr, cmd = self.mapper.map_ir_signal("Samsung32", "0x07", "0x04")
         self.assertEqual(event, "DIGIT_1")
 
+    def test_unmapped_and_unknown(self):
+        """Test fallbacks for known remotes with unknown buttons and unknown remotes"""
+        event, _, _, _ = self.mapper.map_ir_signal("NEC", "0x32", "0x7F")
+        self.assertEqual(event, "UNMAPPED_nec_0x32_0x7F")
+
+        event, _, _, _ = self.mapper.map_ir_signal("RC5", "0x00", "0x01")
+        self.assertEqual(event, "UNKNOWN_RC5_0x00_0x01")
+
+        kind, event = self.mapper.classify_ir_signal("NEC", "0x32", "0x7F")
+        self.assertEqual(kind, EventKind.UNMAPPED)
+
+    def test_hex_case_insensitive(self):
+        """Test that hex case and zero padding do not affect matching"""
+        event, _, _, _ = self.mapper.map_ir_signal("Samsung32", "0x07", "0x0a")
+        self.assertEqual(event, "DIGIT_6")
+
+        event, _, _, _ = self.mapper.map_ir_signal("NEC", "0x32", "0x7f")
+        self.assertEqual(event, "UNMAPPED_nec_0x32_0x7F")
+
+        event, _, _, _ = self.mapper.map_ir_signal("NEC", "0x032", "0x011")
+        self.assertEqual(event, "CHANNEL_UP")
+
+    def test_repeat_events_identical(self):
+        """Test that repeated signals yield the very same event string object"""
+        first, _, _, _ = self.mapper.map_ir_signal("NEC", "0x32", "0x7F")
+        second, _, _, _ = self.mapper.map_ir_signal("NEC", "0x32", "0x7F")
+        self.assertIs(first, second)
+
+        first, _, _, _ = self.mapper.map_ir_signal("RC5", "0x00", "0x01")
+        second, _, _, _ = self.mapper.map_ir_signal("RC5", "0x00", "0x01")
+        self.assertIs(first, second)
+
     def test_debounce_logic(self):
-        """Test that rapid identical signals are debounced"""
+        """Test that the same event from another remote is debounced, but a new event is not"""
+        utils.set_monotonic_source(lambda: 100.0)
+        self.addCleanup(utils.set_monotonic_source, time.monotonic)
         self.mapper.handle_event = MagicMock()
-        
-        # First signal
-        line = "NEC, A:0x32, C:0x11"
-        ir_match = re.match(r'(\w+), A:(0x[0-9A-Fa-f]+), C:(0x[0-9A-Fa-f]+)', line)
-        protocol, address, command = ir_match.groups()
-        event, proto, addr, cmd = self.mapper.map_ir_signal(protocol, address, command)
-        
-        # Process first event
-        self.mapper.handle_event(event, proto, addr, cmd)
-        self.mapper.last_event = event
-        self.mapper.last_event_time = time.time()
-        
-        # Try processing same event immediately
-        current_time = time.time()
-        if event != self.mapper.last_event or (current_time - self.mapper.last_event_time) >= self.args.debounce:
-             self.mapper.handle_event(event, proto, addr, cmd)
-        
-        # Should only have been called once (manually by us)
+
+        self.mapper._process_line(b"NEC, A:0x32, C:0x11")        # CHANNEL_UP
+        self.mapper._process_line(b"Samsung32, A:0x07, C:0x12")  # CHANNEL_UP, other remote
+        self.assertEqual(self.mapper.handle_event.call_count, 1)
+
+        self.mapper._process_line(b"Samsung32, A:0x07, C:0x04")  # DIGIT_1
+        self.assertEqual(self.mapper.handle_event.call_count, 2)
+        self.assertEqual(self.mapper.handle_event.call_args[0][0], "DIGIT_1")
+
+    def test_process_line_dispatch(self):
+        """Test that raw Flipper lines are parsed and noise lines ignored"""
+        self.mapper.handle_event = MagicMock()
+
+        self.mapper._process_line(b"Receiving...")
+        self.mapper.handle_event.assert_not_called()
+
+        self.mapper._process_line(b"NEC, A:0x32, C:0x11")
+        self.mapper.handle_event.assert_called_once_with(
+            "CHANNEL_UP", "NEC", "0x32", "0x11", kind=EventKind.MAPPED)
+
+    def test_digit_events_reach_dialer(self):
+        """Test that DIGIT_n events feed the dialer directly"""
+        self.mapper.channel_dialer.add_digit = MagicMock()
+        self.mapper.handle_event("DIGIT_7")
+        self.mapper.channel_dialer.add_digit.assert_called_once_with(7)
+
+    def test_dialer_shares_socket_writer(self):
+        """Test that dialer commands go through the mapper's socket queue, keeping one write order"""
+        self.assertEqual(self.mapper.channel_dialer.send_command, self.mapper._sock_q.put)
+
+    def test_non_digit_event_not_dialed(self):
+        """Test that DIGIT_ with a non-numeric suffix falls through to the handler table"""
+        self.mapper.channel_dialer.add_digit = MagicMock()
+        self.mapper.handle_event("DIGIT_A")
+        self.mapper.handle_event("DIGIT_/")
+        self.mapper.channel_dialer.add_digit.assert_not_called()
+
+    def test_process_line_debounce(self):
+        """Test that repeats inside the debounce window are dropped on the monotonic clock"""
+        clock = [100.0]
+        utils.set_monotonic_source(lambda: clock[0])
+        self.addCleanup(utils.set_monotonic_source, time.monotonic)
+        self.mapper.handle_event = MagicMock()
+
+        self.mapper._process_line(b"NEC, A:0x32, C:0x11")
+        clock[0] += 0.1
+        self.mapper._process_line(b"NEC, A:0x32, C:0x11")
         self.assertEqual(self.mapper.handle_event.call_count, 1)
 
+        clock[0] += self.args.debounce
+        self.mapper._process_line(b"NEC, A:0x32, C:0x11")
+        self.assertEqual(self.mapper.handle_event.call_count, 2)
+
+    def test_held_button_skips_mapping(self):
+        """Test that a repeated raw signal is dropped before it is mapped"""
+        utils.set_monotonic_source(lambda: 100.0)
+        self.addCleanup(utils.set_monotonic_source, time.monotonic)
+        self.mapper.handle_event = MagicMock()
+
+        self.mapper._process_line(b"NEC, A:0x32, C:0x11")
+        self.mapper.classify_ir_signal = MagicMock()
+        self.mapper._process_line(b"NEC, A:0x32, C:0x11")
+        self.mapper.classify_ir_signal.assert_not_called()
+        self.assertEqual(self.mapper.handle_event.call_count, 1)
+
+    def test_effect_flash_through_dialer(self):
+        """Test that effect feedback uses the dialer's flash, so dialing can cancel it"""
+        self.mapper.channel_dialer.flash = MagicMock()
+        self.mapper._handle_effect_next()
+        self.mapper.channel_dialer.flash.assert_called_once_with("EFuP", 0.5)
+
+    def test_buffered_line_splitting(self):
+        """Test that lines split across serial reads are reassembled"""
+        chunks = [b"NEC, A:0x32, C:0x11\r\nSamsung32, A:0x", b"07, C:0x04\r\n"]
+        self.mapper.flipper = MagicMock()
+        self.mapper.flipper.in_waiting = 0
+        self.mapper.flipper.read.side_effect = chunks
+
+        self.assertEqual(self.mapper._read_lines(), [b"NEC, A:0x32, C:0x11\r"])
+        self.assertEqual(self.mapper._read_lines(), [b"Samsung32, A:0x07, C:0x04\r"])
+        self.assertEqual(self.mapper._rx_buf, bytearray())
+
+    def test_select_gated_read(self):
+        """Test that ready file descriptors are drained with one direct read"""
+        r, w = os.pipe()
+        self.addCleanup(os.close, r)
+        self.addCleanup(os.close, w)
+        os.write(w, b"NEC, A:0x32, C:0x11\r\nSamsung32, A:0x07, C:0x04\r\nNE")
+
+        self.mapper._watch_flipper(r)
+        self.addCleanup(self.mapper._selector.close)
+        self.mapper.flipper = MagicMock()
+
+        self.assertEqual(self.mapper._read_lines(),
+                         [b"NEC, A:0x32, C:0x11\r", b"Samsung32, A:0x07, C:0x04\r"])
+        self.assertEqual(self.mapper._rx_buf, bytearray(b"NE"))
+        self.mapper.flipper.read.assert_not_called()
+
+    def test_spurious_wakeup_read(self):
+        """Test that a ready-but-empty non-blocking fd reads nothing instead of raising"""
+        r, w = os.pipe()
+        self.addCleanup(os.close, r)
+        self.addCleanup(os.close, w)
+        os.set_blocking(r, False)
+
+        self.mapper._watch_flipper(r)
+        self.addCleanup(self.mapper._selector.close)
+        self.mapper._selector = MagicMock()
+        self.mapper._selector.select.return_value = [(None, None)]
+
+        self.assertEqual(self.mapper._read_lines(), [])
+
+    def test_reader_thread_handoff(self):
+        """Test that read lines queue up for dispatch and read errors reach the dispatch loop"""
+        self.mapper._read_lines = MagicMock(side_effect=[[b"A"], [], [b"B", b"C"], OSError("unplugged")])
+        self.mapper._reader_loop()
+
+        self.assertEqual(self.mapper._take_lines(), [b"A", b"B", b"C"])
+        with self.assertRaises(OSError):
+            self.mapper._take_lines()
+
 if __name__ == '__main__':
     unittest.main()
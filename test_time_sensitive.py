@@ -23,6 +23,7 @@ class TestTimeSensitiveLogic(unittest.TestCase):
         
         # Install transparent interception hooks
         utils.set_time_source(self.mock_clock.time)
+        utils.set_monotonic_source(self.mock_clock.time)
         utils.set_sleep_source(self.mock_clock.sleep)
         utils.set_timer_source(self._mock_timer)
 
@@ -32,6 +33,7 @@ class TestTimeSensitiveLogic(unittest.TestCase):
         # Restore real sources
         import time
         utils.set_time_source(time.time)
+        utils.set_monotonic_source(time.monotonic)
         utils.set_sleep_source(time.sleep)
         utils.set_timer_source(threading.Timer)
 
@@ -102,6 +104,100 @@ class TestTimeSensitiveLogic(unittest.TestCase):
         self.mock_display.send_display_command.assert_any_call("DISP:0002")
         self.mock_display.send_display_command.assert_any_call("LED:nack")
 
+    def test_celestial_aliases_share_cooldown(self):
+        """Test that 9696 cannot be used to dodge the 6969 cooldown"""
+        for digit in (6, 9, 6, 9):
+            self.dialer.add_digit(digit)
+        self.mock_display.send_display_command.assert_any_call("DISP:STAR")
+        self.mock_display.send_display_command.reset_mock()
+
+        # Past the 2s dialing debounce, still inside the 20s cooldown
+        self.mock_clock.current_time += 3.0
+
+        for digit in (9, 6, 9, 6):
+            self.dialer.add_digit(digit)
+        self.mock_display.send_display_command.assert_any_call("LED:nack")
+        self.mock_display.send_display_command.assert_any_call("DISP:0017")
+
+    def test_cooldown_available_right_after_boot(self):
+        """Test that a fresh monotonic clock (e.g. just booted) does not lock out eggs"""
+        self.mock_clock.current_time = 5.0
+        self.assertTrue(self.dialer.cooldown_manager.can_activate("911", 3600))
+        self.assertEqual(self.dialer.cooldown_manager.get_time_until_available("911", 3600), 0)
+
+    def test_digit_timer_rearms_instead_of_churning(self):
+        """Test that one timer covers a dialing session and waits out late digits"""
+        self.dialer.current_channel = 1
+        self.dialer.add_digit(1)
+        self.mock_clock.current_time += 1.0
+        self.dialer.add_digit(3)
+        self.assertEqual(len(self.timers), 1)
+
+        # Fires 1.5s after the first digit - only 0.5s since the last one
+        self.mock_clock.current_time += 0.5
+        self._trigger_timers(interval=1.5)
+        self.assertEqual(self.dialer.current_channel, 1)
+        self.assertEqual(len(self.timers), 1)
+        self.assertAlmostEqual(self.timers[0].interval, 1.0)
+
+        self.mock_clock.current_time += 1.0
+        self._trigger_timers()
+        self.assertEqual(self.dialer.current_channel, 13)
+
+    def test_channel_change_flash_does_not_block(self):
+        """Test that UP is flashed and the new channel restored by a timer, not a sleep"""
+        self.dialer.current_channel = 1
+        self.dialer.channel_up()
+        self.assertEqual(self.dialer.current_channel, 2)
+        self.mock_display.display_text.assert_called_with("UP")
+        self.mock_display.display_number.assert_not_called()
+
+        self._trigger_timers(interval=0.4)
+        self.mock_display.display_number.assert_called_with(2)
+
+    def test_dialing_cancels_flash_restore(self):
+        """Test that a digit dialed during a flash drops the pending channel restore"""
+        self.dialer.current_channel = 2
+        self.dialer.flash("INFO", 1.5)
+        flash_timer = self.timers[-1]
+
+        self.dialer.add_digit(1)
+        flash_timer.cancel.assert_called_once()
+        self.assertIsNone(self.dialer._flash_timer)
+
+    def test_superseded_flash_restore_is_ignored(self):
+        """Test that a restore firing after a newer flash leaves the display alone"""
+        self.dialer.current_channel = 2
+        self.dialer.flash("INFO", 1.5)
+        self.dialer.flash("UP", 0.4)
+        stale, current = self.timers
+
+        stale.function(*stale.args)
+        self.mock_display.display_number.assert_not_called()
+        self.assertIs(self.dialer._flash_timer, current)
+
+        current.function(*current.args)
+        self.mock_display.display_number.assert_called_once_with(2)
+        self.assertIsNone(self.dialer._flash_timer)
+
+    def test_timed_out_egg_runs_under_lock(self):
+        """Test that an Easter egg fired by the digit timer holds the dialer lock while it runs"""
+        held = []
+        def probe_lock():
+            acquired = self.dialer.lock.acquire(blocking=False)
+            if acquired:
+                self.dialer.lock.release()
+            held.append(not acquired)
+        def action():
+            probe = threading.Thread(target=probe_lock)
+            probe.start()
+            probe.join()
+        self.dialer.add_custom_easter_egg("4242", "probe", "PROB", action)
+
+        self.dialer._digits = "4242"
+        self.dialer._process_channel()
+        self.assertEqual(held, [True])
+
     def test_effect_duration_cleanup(self):
         self.timers = []
         self.dialer.add_digit(9)
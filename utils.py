@@ -3,6 +3,16 @@ import subprocess
 import json
 import time
 import threading
+import socket
+import shutil
+
+# orjson is optional - it serializes straight to compact bytes, several times faster
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(data):
+        return json.dumps(data, separators=(',', ':')).encode()
 
 # Configuration that might be shared
 SOCKET_PATH = "/home/appuser/FieldStation42/runtime/channel.socket"
@@ -11,6 +21,7 @@ IS_MOCK = os.environ.get("MOCK_MODE", "false").lower() == "true"
 # --- Transparent Time Interception ---
 # These can be swapped out by the test suite to control "reality"
 _time_source = time.time
+_monotonic_source = time.monotonic
 _sleep_source = time.sleep
 _timer_source = threading.Timer
 
@@ -18,6 +29,10 @@ def get_now():
     """Project-wide 'now' - defaults to real time"""
     return _time_source()
 
+def get_monotonic():
+    """Project-wide monotonic clock for cooldowns/intervals - immune to NTP/DST jumps"""
+    return _monotonic_source()
+
 def sleep(seconds):
     """Project-wide 'sleep' - defaults to real sleep"""
     return _sleep_source(seconds)
@@ -30,44 +45,120 @@ def start_timer(interval, function, args=None, kwargs=None):
 
 # --- Test Harness Hooks (Only used by tests) ---
 def set_time_source(func): global _time_source; _time_source = func
+def set_monotonic_source(func): global _monotonic_source; _monotonic_source = func
 def set_sleep_source(func): global _sleep_source; _sleep_source = func
 def set_timer_source(func): global _timer_source; _timer_source = func
 
 # --- Existing Utilities ---
-def safe_execute(func, error_msg="Operation failed"):
-    """Decorator for safe function execution with error handling"""
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except Exception as e:
-            if not IS_MOCK:
-                print(f"{error_msg}: {e}")
-            return None
-    return wrapper
-
-@safe_execute
+# These never raise: failures are reported (outside mock mode) and swallowed
+
+_socket_dir_ready = False
+_socket_lock = threading.Lock()  # A dialer without the mapper's writer writes from IR and timer threads
+
 def write_json_to_socket(data):
     """Write JSON data to socket"""
-    json_str = json.dumps(data)
-    if IS_MOCK:
-        print(f"DEBUG [MockSocket] Write to {SOCKET_PATH}: {json_str}")
-        return
-        
-    os.makedirs(os.path.dirname(SOCKET_PATH), exist_ok=True)
-    with open(SOCKET_PATH, 'w') as f:
-        f.write(json_str)
-    print(f"JSON written: {json_str}")
+    global _socket_dir_ready
+    try:
+        payload = _dumps(data)
+        if IS_MOCK:
+            print(f"DEBUG [MockSocket] Write to {SOCKET_PATH}: {payload.decode()}")
+            return
+
+        # Despite the name this is a regular file the consumer reads, so it is rewritten.
+        # Raw os.open/os.write skips the text-file wrapper; O_NONBLOCK keeps a FIFO with
+        # no reader from hanging the caller. Truncate-then-write is not atomic, so writers
+        # take turns or two commands could interleave into invalid JSON.
+        with _socket_lock:
+            if not _socket_dir_ready:
+                os.makedirs(os.path.dirname(SOCKET_PATH), exist_ok=True)
+                _socket_dir_ready = True
+            fd = os.open(SOCKET_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NONBLOCK, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+        print(f"JSON written: {payload.decode()}")
+    except Exception as e:
+        if not IS_MOCK:
+            print(f"Socket write failed: {e}")
+
+# mpv JSON IPC (mpv --input-ipc-server=...) - preferred over forking xdotool per key
+MPV_IPC_PATH = os.environ.get("MPV_IPC_SOCKET", "/tmp/mpvsocket")
+# xdotool key names that mpv spells differently
+_MPV_KEY_NAMES = {'space': 'SPACE', 'Return': 'ENTER'}
+# Resolved once so each xdotool call skips the PATH search; full env so X auth etc. survive
+_XDOTOOL = shutil.which('xdotool') or 'xdotool'
+_X_ENV = {**os.environ, 'DISPLAY': ':0'}
+
+_mpv_lock = threading.Lock()  # Keys arrive from the IR loop, dialer and Easter egg timers
+_mpv_sock = None
+_mpv_window = None  # Cached xdotool window id for when IPC is unavailable
+
+MPV_IPC_TIMEOUT = 0.5  # A wedged mpv must not hang key senders; fall back to xdotool
+MPV_IPC_BACKOFF = 30   # Seconds to use xdotool only after mpv stopped servicing IPC
+_mpv_ipc_retry_at = 0
+
+def _drain_mpv_replies():
+    """Discard replies mpv has queued so its side of the socket never fills up"""
+    # With a timeout set the fd is non-blocking underneath; os.read skips the socket
+    # module's wait-for-readable, so an empty buffer returns immediately
+    while True:
+        try:
+            if not os.read(_mpv_sock.fileno(), 4096):
+                raise ConnectionResetError("mpv closed the IPC socket")
+        except BlockingIOError:
+            return
+
+def _send_key_ipc(key):
+    """Send a keypress over mpv's IPC socket; returns False if mpv isn't listening"""
+    global _mpv_sock, _mpv_ipc_retry_at
+    if get_monotonic() < _mpv_ipc_retry_at:
+        return False
+    payload = json.dumps({"command": ["keypress", _MPV_KEY_NAMES.get(key, key)]}).encode() + b'\n'
+    for _ in range(2):  # Second pass reconnects once after a dropped connection
+        try:
+            if _mpv_sock is None:
+                _mpv_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                _mpv_sock.settimeout(MPV_IPC_TIMEOUT)
+                _mpv_sock.connect(MPV_IPC_PATH)
+                # Only command replies are left to drain, not mpv's event stream
+                _mpv_sock.sendall(b'{"command":["disable_event","all"]}\n')
+            _drain_mpv_replies()
+            _mpv_sock.sendall(payload)
+            return True
+        except socket.timeout:
+            _mpv_sock.close()
+            _mpv_sock = None
+            _mpv_ipc_retry_at = get_monotonic() + MPV_IPC_BACKOFF  # Don't keep waiting on it
+            return False
+        except OSError:
+            if _mpv_sock:
+                _mpv_sock.close()
+            _mpv_sock = None
+    return False
+
+def _send_key_xdotool(key):
+    """Send a key with xdotool, searching for the mpv window only when needed"""
+    global _mpv_window
+    if _mpv_window is None:
+        _mpv_window = subprocess.check_output(
+            [_XDOTOOL, 'search', '--onlyvisible', '--class', 'mpv'],
+            env=_X_ENV
+        ).decode().strip().split('\n')[0]
+    result = subprocess.run([_XDOTOOL, 'key', '--window', _mpv_window, key], env=_X_ENV)
+    if result.returncode != 0:
+        _mpv_window = None  # mpv restarted - search again next time
 
-@safe_execute
 def send_key_to_mpv(key):
     """Send key to mpv window"""
     if IS_MOCK:
         print(f"DEBUG [MockXdotool] Send key '{key}' to MPV")
         return
 
-    window_id = subprocess.check_output(
-        ['xdotool', 'search', '--onlyvisible', '--class', 'mpv'],
-        env={'DISPLAY': ':0'}
-    ).decode().strip().split('\n')[0]
-    subprocess.run(['xdotool', 'key', '--window', window_id, key], env={'DISPLAY': ':0'})
-    print(f"Sent key '{key}' to MPV")
+    try:
+        with _mpv_lock:
+            if not _send_key_ipc(key):
+                _send_key_xdotool(key)
+        print(f"Sent key '{key}' to MPV")
+    except Exception as e:
+        print(f"MPV key send failed: {e}")